@@ -11,9 +11,13 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
 from md1.md1_queue import simulate_md1, theoretical_waiting_queue_time_md1
+from shared.decimation import decimate_for_plot
 
 
-def run_case(lam: float, mu: float = 1.0, sim_time: float = 10000.0) -> None:
+def run_case(lam: float, mu: float = 1.0, sim_time: float = 10000.0, fmt: str = "png") -> None:
+    """Simulate one (λ, μ) point and save its convergence plot as md1_lambda_<λ>_mu_<μ>.<fmt>."""
+    if fmt not in ("png", "svg"):
+        raise ValueError(f"Unsupported format: {fmt!r} (use 'png' or 'svg')")
     print("=" * 70)
     print(f"M/D/1 Queue Simulation: λ = {lam}, μ = {mu}")
     print("=" * 70)
@@ -47,7 +51,11 @@ def run_case(lam: float, mu: float = 1.0, sim_time: float = 10000.0) -> None:
     mean_vals = result["mean_wait_queue_times"]
     mean_times = result["mean_wait_queue_times_times"]
     if mean_vals:
-        plt.figure(figsize=(10, 5))
+        fig = plt.figure(figsize=(10, 5), dpi=150)
+        # One point per departure is far more than the plot has pixels
+        mean_times, mean_vals = decimate_for_plot(
+            mean_times, mean_vals, width_px=int(fig.get_figwidth() * fig.dpi)
+        )
         plt.plot(mean_times, mean_vals, "b-", label="Simulated Wq (running mean)", linewidth=2)
         plt.axhline(
             y=mean_Wq_theory,
@@ -62,19 +70,19 @@ def run_case(lam: float, mu: float = 1.0, sim_time: float = 10000.0) -> None:
         plt.grid(True, alpha=0.3)
         plt.legend()
         plt.tight_layout()
-        filename = f"md1_lambda_{lam}_mu_{mu}.png"
-        plt.savefig(filename, dpi=150)
+        filename = f"md1_lambda_{lam}_mu_{mu}.{fmt}"
+        plt.savefig(filename, dpi=fig.dpi)
         print(f"  Plot saved to: {filename}")
         plt.close()  # Close the figure to free memory and continue
 
 
-def main() -> None:
+def main(fmt: str = "png") -> None:
     # Two required checkpoints
-    run_case(lam=0.5, mu=1.0, sim_time=20000.0)
-    run_case(lam=0.9, mu=1.0, sim_time=20000.0)
+    run_case(lam=0.5, mu=1.0, sim_time=20000.0, fmt=fmt)
+    run_case(lam=0.9, mu=1.0, sim_time=20000.0, fmt=fmt)
 
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:2])
 
 
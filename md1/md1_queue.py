@@ -8,11 +8,14 @@ Reuses:
 """
 
 import heapq
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from shared.arrival_generating import ArrivalGenerating
+from shared.batched_queue import simulate_batched
+from shared.checkpoint import load_snapshot, prepare_series_files, save_snapshot
 from shared.fifo_queue import FIFOQueue
 from shared.service_unit import DeterministicServiceUnit
 
@@ -29,36 +32,89 @@ def simulate_md1(
     lambda_rate: float,
     mu_rate: float = 1.0,
     sim_time: float = 10000.0,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: float = 600.0,
+    resume_from: Optional[str] = None,
 ) -> Dict[str, List[float]]:
     """Run an M/D/1 simulation.
 
+    Events up to sim_time are processed. With checkpoint_path set, the full
+    state is written there every checkpoint_interval wall-clock seconds and
+    once more at the end, and the returned series are appended to files
+    next to it (see shared/checkpoint.py). Passing a snapshot as resume_from continues that
+    run bit-exactly, either after a kill or to extend a finished run to a
+    longer sim_time.
+
     Args:
         lambda_rate: Arrival rate λ.
         mu_rate: Service rate μ.
         sim_time: Simulation end time.
+        checkpoint_path: Snapshot file to write, or None to disable checkpoints.
+        checkpoint_interval: Wall-clock seconds between snapshots.
+        resume_from: Snapshot file to resume from.
     """
-    arrivals = ArrivalGenerating(lambda_rate)
     server = DeterministicServiceUnit(mu_rate)
     queue = FIFOQueue()
 
-    events: List[Tuple[float, str, int]] = []  # (event_time, event_type, entity_id)
-
-    current_time = 0.0
-
-    wait_queue_times: List[float] = []
-    service_times: List[float] = []
-    system_times: List[float] = []
-    mean_wait_queue_times: List[float] = []
-    mean_wait_queue_times_times: List[float] = []
-
-    arrival_time: Dict[int, float] = {}
-    service_start_time: Dict[int, float] = {}
-
-    first_arrival_time = arrivals.next_interarrival()
-    first_entity_id = arrivals.next_entity_id()
-    heapq.heappush(events, (first_arrival_time, "arrival", first_entity_id))
+    if resume_from is not None:
+        snapshot = load_snapshot(resume_from, "md1", lambda_rate, mu_rate, sim_time)
+        arrivals = ArrivalGenerating(lambda_rate, snapshot["next_entity_id"])
+        server.busy = snapshot["server_busy"]
+        for entity_id in snapshot["queue"]:
+            queue.push(entity_id)
+        events: List[Tuple[float, str, int]] = snapshot["events"]
+        current_time = snapshot["current_time"]
+        pending_arrival: Optional[float] = snapshot["pending_arrival"]
+        arrival_time: Dict[int, float] = snapshot["arrival_time"]
+        service_start_time: Dict[int, float] = snapshot["service_start_time"]
+        wait_sum = snapshot["accumulators"]["wait_sum"]
+        stats = snapshot["stats"]
+    else:
+        arrivals = ArrivalGenerating(lambda_rate)
+        events = []  # (event_time, event_type, entity_id)
+        current_time = 0.0
+        pending_arrival = arrivals.next_interarrival()  # drawn but not yet scheduled
+        arrival_time = {}
+        service_start_time = {}
+        wait_sum = 0.0
+        stats = {
+            "wait_queue_times": [],
+            "service_times": [],
+            "system_times": [],
+            "mean_wait_queue_times": [],
+            "mean_wait_queue_times_times": [],
+        }
+
+    wait_queue_times = stats["wait_queue_times"]
+    service_times = stats["service_times"]
+    system_times = stats["system_times"]
+    mean_wait_queue_times = stats["mean_wait_queue_times"]
+    mean_wait_queue_times_times = stats["mean_wait_queue_times_times"]
+
+    if checkpoint_path is not None:
+        flushed = prepare_series_files(
+            checkpoint_path,
+            resume_from,
+            {name: len(values) for name, values in stats.items()},
+        )
+
+    def checkpoint() -> None:
+        save_snapshot(
+            checkpoint_path, "md1", lambda_rate, mu_rate, current_time, events, queue,
+            server.busy, arrivals, pending_arrival, arrival_time, service_start_time,
+            {"wait_sum": wait_sum}, stats, flushed,
+        )
+
+    next_checkpoint = time.monotonic() + checkpoint_interval
+
+    while True:
+        if pending_arrival is not None and pending_arrival <= sim_time:
+            heapq.heappush(events, (pending_arrival, "arrival", arrivals.next_entity_id()))
+            pending_arrival = None
+
+        if not events or events[0][0] > sim_time:
+            break
 
-    while events and current_time < sim_time:
         current_time, event_type, entity_id = heapq.heappop(events)
 
         if event_type == "arrival":
@@ -74,11 +130,7 @@ def simulate_md1(
             else:
                 queue.push(entity_id)
 
-            if current_time < sim_time:
-                next_arrival_time = current_time + arrivals.next_interarrival()
-                if next_arrival_time <= sim_time:
-                    next_entity_id = arrivals.next_entity_id()
-                    heapq.heappush(events, (next_arrival_time, "arrival", next_entity_id))
+            pending_arrival = current_time + arrivals.next_interarrival()
 
         else:  # departure
             start = service_start_time.get(entity_id, current_time)
@@ -86,10 +138,11 @@ def simulate_md1(
             wait_q = max(0.0, start - arr)
             wait_queue_times.append(wait_q)
 
-            system_times.append(max(0.0, current_time - arr))
+            system_time = max(0.0, current_time - arr)
+            system_times.append(system_time)
 
-            mean_wait_q = float(np.mean(wait_queue_times))
-            mean_wait_queue_times.append(mean_wait_q)
+            wait_sum += wait_q
+            mean_wait_queue_times.append(wait_sum / len(wait_queue_times))
             mean_wait_queue_times_times.append(current_time)
 
             arrival_time.pop(entity_id, None)
@@ -105,6 +158,13 @@ def simulate_md1(
             else:
                 server.busy = False
 
+        if checkpoint_path is not None and time.monotonic() >= next_checkpoint:
+            checkpoint()
+            next_checkpoint = time.monotonic() + checkpoint_interval
+
+    if checkpoint_path is not None:
+        checkpoint()
+
     return {
         "wait_queue_times": wait_queue_times,
         "service_times": service_times,
@@ -114,4 +174,17 @@ def simulate_md1(
     }
 
 
+def simulate_md1_batched(
+    lambda_rates: Union[float, Sequence[float]],
+    mu_rates: Union[float, Sequence[float]] = 1.0,
+    sim_time: float = 10000.0,
+    n_replications: int = 100,
+) -> Dict[str, np.ndarray]:
+    """Run R replications of the M/D/1 queue at P parameter points in one vectorized pass.
 
+    Replaces P × R separate simulate_md1 calls; see shared/batched_queue.py
+    for the returned per-cell Wq / Lq arrays and confidence intervals.
+    """
+    return simulate_batched(
+        lambda_rates, mu_rates, sim_time, n_replications, service="deterministic"
+    )
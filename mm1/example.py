@@ -4,12 +4,26 @@ M/M/1 Queue Example (single parameter set)
 Uses the modular simulation in mm1_queue.py.
 """
 
+from typing import Optional
+
 import matplotlib.pyplot as plt
+import sys
+import os
+
+# Add parent directory to path so we can import shared and mm1 modules
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
 
-from mm1_queue import simulate_mm1, theoretical_waiting_queue_time
+from mm1.mm1_queue import simulate_mm1, theoretical_waiting_queue_time
+from shared.decimation import decimate_for_plot
 
 
-def main() -> None:
+def main(fmt: Optional[str] = None) -> None:
+    """Run the example; with fmt (png/svg), save the convergence plot as
+    mm1_lambda_<λ>_mu_<μ>.<fmt> instead of showing it."""
+    if fmt is not None and fmt not in ("png", "svg"):
+        raise ValueError(f"Unsupported format: {fmt!r} (use 'png' or 'svg')")
+
     # Simulation parameters
     lam, mu, T = 0.5, 1.0, 10000.0
 
@@ -49,7 +63,12 @@ def main() -> None:
     mean_vals = result["mean_wait_queue_times"]
     mean_times = result["mean_wait_queue_times_times"]
     if mean_vals:
-        plt.figure(figsize=(12, 6))
+        # Saved figures use 150 dpi, shown ones the backend default
+        fig = plt.figure(figsize=(12, 6), dpi=150 if fmt else None)
+        # One point per departure is far more than the plot has pixels
+        mean_times, mean_vals = decimate_for_plot(
+            mean_times, mean_vals, width_px=int(fig.get_figwidth() * fig.dpi)
+        )
         plt.plot(mean_times, mean_vals, "b-", label="Simulated Wq (running mean)", linewidth=2)
         plt.axhline(
             y=mean_Wq_theory,
@@ -64,9 +83,15 @@ def main() -> None:
         plt.legend()
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
-        plt.show()
+        if fmt:
+            filename = f"mm1_lambda_{lam}_mu_{mu}.{fmt}"
+            plt.savefig(filename, dpi=fig.dpi)
+            print(f"Plot saved to: {filename}")
+            plt.close()
+        else:
+            plt.show()
 
 
 if __name__ == "__main__":
-    main()
+    main(*sys.argv[1:2])
 
@@ -10,11 +10,14 @@ and exposes a function-based simulation API.
 """
 
 import heapq
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from shared.arrival_generating import ArrivalGenerating
+from shared.batched_queue import simulate_batched
+from shared.checkpoint import load_snapshot, prepare_series_files, save_snapshot
 from shared.service_unit import ServiceUnit
 from shared.fifo_queue import FIFOQueue
 
@@ -30,13 +33,26 @@ def simulate_mm1(
     lambda_rate: float,
     mu_rate: float = 1.0,
     sim_time: float = 10000.0,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_interval: float = 600.0,
+    resume_from: Optional[str] = None,
 ) -> Dict[str, List[float]]:
     """Run a modular M/M/1 simulation.
 
+    Events up to sim_time are processed. With checkpoint_path set, the full
+    state is written there every checkpoint_interval wall-clock seconds and
+    once more at the end, and the returned series are appended to files
+    next to it (see shared/checkpoint.py). Passing a snapshot as resume_from continues that
+    run bit-exactly, either after a kill or to extend a finished run to a
+    longer sim_time.
+
     Args:
         lambda_rate: Arrival rate λ.
         mu_rate: Service rate μ.
         sim_time: Simulation end time.
+        checkpoint_path: Snapshot file to write, or None to disable checkpoints.
+        checkpoint_interval: Wall-clock seconds between snapshots.
+        resume_from: Snapshot file to resume from.
 
     Returns:
         Dictionary with lists:
@@ -46,32 +62,78 @@ def simulate_mm1(
             - 'mean_wait_queue_times': running mean of queue waiting time
             - 'mean_wait_queue_times_times': times when running mean was computed
     """
-    arrivals = ArrivalGenerating(lambda_rate)
     server = ServiceUnit(mu_rate)
     queue = FIFOQueue()
 
-    # Event queue: (event_time, event_type, entity_id)
-    events: List[Tuple[float, str, int]] = []
-
-    current_time = 0.0
-
-    # Statistics
-    wait_queue_times: List[float] = []
-    service_times: List[float] = []
-    system_times: List[float] = []
-    mean_wait_queue_times: List[float] = []
-    mean_wait_queue_times_times: List[float] = []
+    if resume_from is not None:
+        snapshot = load_snapshot(resume_from, "mm1", lambda_rate, mu_rate, sim_time)
+        arrivals = ArrivalGenerating(lambda_rate, snapshot["next_entity_id"])
+        server.busy = snapshot["server_busy"]
+        for entity_id in snapshot["queue"]:
+            queue.push(entity_id)
+        events: List[Tuple[float, str, int]] = snapshot["events"]
+        current_time = snapshot["current_time"]
+        pending_arrival: Optional[float] = snapshot["pending_arrival"]
+        arrival_time: Dict[int, float] = snapshot["arrival_time"]
+        service_start_time: Dict[int, float] = snapshot["service_start_time"]
+        wait_sum = snapshot["accumulators"]["wait_sum"]
+        stats = snapshot["stats"]
+    else:
+        arrivals = ArrivalGenerating(lambda_rate)
+
+        # Event queue: (event_time, event_type, entity_id)
+        events = []
+
+        current_time = 0.0
+
+        # Next arrival time, drawn but not yet scheduled
+        pending_arrival = arrivals.next_interarrival()
+
+        # For each entity: track arrival time and service start time
+        arrival_time = {}
+        service_start_time = {}
+
+        # Statistics
+        wait_sum = 0.0
+        stats = {
+            "wait_queue_times": [],
+            "service_times": [],
+            "system_times": [],
+            "mean_wait_queue_times": [],
+            "mean_wait_queue_times_times": [],
+        }
+
+    wait_queue_times = stats["wait_queue_times"]
+    service_times = stats["service_times"]
+    system_times = stats["system_times"]
+    mean_wait_queue_times = stats["mean_wait_queue_times"]
+    mean_wait_queue_times_times = stats["mean_wait_queue_times_times"]
+
+    if checkpoint_path is not None:
+        flushed = prepare_series_files(
+            checkpoint_path,
+            resume_from,
+            {name: len(values) for name, values in stats.items()},
+        )
+
+    def checkpoint() -> None:
+        save_snapshot(
+            checkpoint_path, "mm1", lambda_rate, mu_rate, current_time, events, queue,
+            server.busy, arrivals, pending_arrival, arrival_time, service_start_time,
+            {"wait_sum": wait_sum}, stats, flushed,
+        )
+
+    next_checkpoint = time.monotonic() + checkpoint_interval
+
+    while True:
+        # Schedule the next arrival once it falls inside the horizon
+        if pending_arrival is not None and pending_arrival <= sim_time:
+            heapq.heappush(events, (pending_arrival, "arrival", arrivals.next_entity_id()))
+            pending_arrival = None
+
+        if not events or events[0][0] > sim_time:
+            break
 
-    # For each entity: track arrival time and service start time
-    arrival_time: Dict[int, float] = {}
-    service_start_time: Dict[int, float] = {}
-
-    # Schedule first arrival
-    first_arrival_time = arrivals.next_interarrival()
-    first_entity_id = arrivals.next_entity_id()
-    heapq.heappush(events, (first_arrival_time, "arrival", first_entity_id))
-
-    while events and current_time < sim_time:
         current_time, event_type, entity_id = heapq.heappop(events)
 
         if event_type == "arrival":
@@ -90,12 +152,8 @@ def simulate_mm1(
                 # Join FIFO queue
                 queue.push(entity_id)
 
-            # Schedule next arrival
-            if current_time < sim_time:
-                next_arrival_time = current_time + arrivals.next_interarrival()
-                if next_arrival_time <= sim_time:
-                    next_entity_id = arrivals.next_entity_id()
-                    heapq.heappush(events, (next_arrival_time, "arrival", next_entity_id))
+            # Draw next arrival
+            pending_arrival = current_time + arrivals.next_interarrival()
 
         else:  # departure
             # Compute waiting in queue (arrival → service start)
@@ -105,11 +163,12 @@ def simulate_mm1(
             wait_queue_times.append(wait_q)
 
             # Total time in system (arrival → departure)
-            system_times.append(max(0.0, current_time - arr))
+            system_time = max(0.0, current_time - arr)
+            system_times.append(system_time)
 
             # Update running mean waiting time in queue
-            mean_wait_q = float(np.mean(wait_queue_times))
-            mean_wait_queue_times.append(mean_wait_q)
+            wait_sum += wait_q
+            mean_wait_queue_times.append(wait_sum / len(wait_queue_times))
             mean_wait_queue_times_times.append(current_time)
 
             # Clean up
@@ -127,6 +186,13 @@ def simulate_mm1(
             else:
                 server.busy = False
 
+        if checkpoint_path is not None and time.monotonic() >= next_checkpoint:
+            checkpoint()
+            next_checkpoint = time.monotonic() + checkpoint_interval
+
+    if checkpoint_path is not None:
+        checkpoint()
+
     return {
         "wait_queue_times": wait_queue_times,
         "service_times": service_times,
@@ -135,3 +201,18 @@ def simulate_mm1(
         "mean_wait_queue_times_times": mean_wait_queue_times_times,
     }
 
+
+def simulate_mm1_batched(
+    lambda_rates: Union[float, Sequence[float]],
+    mu_rates: Union[float, Sequence[float]] = 1.0,
+    sim_time: float = 10000.0,
+    n_replications: int = 100,
+) -> Dict[str, np.ndarray]:
+    """Run R replications of the M/M/1 queue at P parameter points in one vectorized pass.
+
+    Replaces P × R separate simulate_mm1 calls; see shared/batched_queue.py
+    for the returned per-cell Wq / Lq arrays and confidence intervals.
+    """
+    return simulate_batched(
+        lambda_rates, mu_rates, sim_time, n_replications, service="exponential"
+    )
@@ -4,13 +4,39 @@ M/M/1 Queue – ρ sweep visualization
 Plots simulated vs theoretical waiting queue time Wq over a range of ρ values.
 """
 
+from typing import Optional
+
 import numpy as np
 import matplotlib.pyplot as plt
+import sys
+import os
+
+# Add parent directory to path so we can import shared and mm1 modules
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+from mm1.mm1_queue import (
+    simulate_mm1,
+    simulate_mm1_batched,
+    theoretical_waiting_queue_time,
+)
+from shared.adaptive_sweep import adaptive_sweep
+
 
-from mm1_queue import simulate_mm1, theoretical_waiting_queue_time
+def _finish_figure(save_path: Optional[str]) -> None:
+    """Save and close the current figure if save_path is given, otherwise show it."""
+    if save_path:
+        plt.savefig(save_path, dpi=150)
+        plt.close()
+    else:
+        plt.show()
 
 
-def sweep_rho_and_plot(mu: float = 1.0, sim_time: float = 10000.0) -> None:
+def sweep_rho_and_plot(
+    mu: float = 1.0,
+    sim_time: float = 10000.0,
+    save_path: Optional[str] = None,
+) -> None:
     """Plot Wq (simulated vs theoretical) for ρ in [0.05, 0.98] with step 0.05."""
     rhos = np.arange(0.05, 0.99, 0.05)
 
@@ -38,7 +64,75 @@ def sweep_rho_and_plot(mu: float = 1.0, sim_time: float = 10000.0) -> None:
     plt.grid(True, alpha=0.3)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    _finish_figure(save_path)
+
+
+def adaptive_sweep_rho_and_plot(
+    mu: float = 1.0,
+    total_sim_time: float = 190000.0,
+    save_path: Optional[str] = None,
+) -> None:
+    """Plot Wq (simulated vs theoretical) on an adaptively refined ρ grid in [0.05, 0.95].
+
+    The total simulation time is split across points in proportion to the
+    standard deviation of each Wq estimate (see shared/adaptive_sweep.py),
+    so points closer to ρ = 1 get more of the budget.
+    """
+    sweep = adaptive_sweep(
+        simulate_mm1, theoretical_waiting_queue_time, mu, total_sim_time, rho_max=0.95
+    )
+    rhos = sweep["rhos"]
+
+    for rho, sim_mean, theory, t in zip(
+        rhos, sweep["simulated_wq"], sweep["theoretical_wq"], sweep["sim_times"]
+    ):
+        print(f"ρ={rho:.3f}, sim_time={t:.0f}: simulated Wq={sim_mean:.4f}, theoretical Wq={theory:.4f}")
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(rhos, sweep["simulated_wq"], "bo-", label="Simulated Wq (adaptive)")
+    plt.plot(rhos, sweep["theoretical_wq"], "r--", label="Theoretical Wq")
+    plt.xlabel("ρ = λ / μ")
+    plt.ylabel("Mean Waiting Time in Queue (Wq)")
+    plt.title("M/M/1 Queue: Simulated vs Theoretical Wq over ρ (adaptive grid)")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    _finish_figure(save_path)
+
+
+def batched_sweep_rho_and_plot(
+    mu: float = 1.0,
+    sim_time: float = 10000.0,
+    n_replications: int = 100,
+    save_path: Optional[str] = None,
+) -> None:
+    """Plot Wq with 95% confidence intervals for ρ in [0.05, 0.98], all replications in one batch."""
+    rhos = np.arange(0.05, 0.99, 0.05)
+    result = simulate_mm1_batched(rhos * mu, mu, sim_time, n_replications)
+    theoretical_wq = [theoretical_waiting_queue_time(rho * mu, mu) for rho in rhos]
+
+    for rho, sim_mean, low, high, theory in zip(
+        rhos, result["wq_mean"], result["wq_ci_low"], result["wq_ci_high"], theoretical_wq
+    ):
+        print(f"ρ={rho:.2f}: simulated Wq={sim_mean:.4f} [{low:.4f}, {high:.4f}], theoretical Wq={theory:.4f}")
+
+    plt.figure(figsize=(10, 6))
+    plt.errorbar(
+        rhos,
+        result["wq_mean"],
+        yerr=[result["wq_mean"] - result["wq_ci_low"], result["wq_ci_high"] - result["wq_mean"]],
+        fmt="bo-",
+        capsize=3,
+        label=f"Simulated Wq ({n_replications} replications, 95% CI)",
+    )
+    plt.plot(rhos, theoretical_wq, "r--", label="Theoretical Wq")
+    plt.xlabel("ρ = λ / μ")
+    plt.ylabel("Mean Waiting Time in Queue (Wq)")
+    plt.title("M/M/1 Queue: Simulated vs Theoretical Wq over ρ (batched replications)")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    _finish_figure(save_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Batch-render every sweep figure to PNG or SVG in one process.
+
+Uses the non-interactive Agg backend, so no window is opened and each figure
+is saved and closed as soon as it is drawn.
+
+Usage:
+    python render_figures.py [out_dir] [png|svg]
+"""
+
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from md1.md1_visualization import (
+    adaptive_sweep_rho_and_plot as md1_adaptive_sweep,
+    batched_sweep_rho_and_plot as md1_batched_sweep,
+    sweep_rho_and_plot as md1_sweep,
+)
+from mm1.mm1_visualization import (
+    adaptive_sweep_rho_and_plot as mm1_adaptive_sweep,
+    batched_sweep_rho_and_plot as mm1_batched_sweep,
+    sweep_rho_and_plot as mm1_sweep,
+)
+
+
+def render_all(out_dir: str = "figures", fmt: str = "png") -> None:
+    """Render the fixed-grid, adaptive and batched ρ sweeps of M/M/1 and M/D/1."""
+    if fmt not in ("png", "svg"):
+        raise ValueError(f"Unsupported format: {fmt!r} (use 'png' or 'svg')")
+    os.makedirs(out_dir, exist_ok=True)
+
+    figures = [
+        ("mm1_rho_sweep", mm1_sweep),
+        ("mm1_rho_sweep_adaptive", mm1_adaptive_sweep),
+        ("mm1_rho_sweep_batched", mm1_batched_sweep),
+        ("md1_rho_sweep", md1_sweep),
+        ("md1_rho_sweep_adaptive", md1_adaptive_sweep),
+        ("md1_rho_sweep_batched", md1_batched_sweep),
+    ]
+    for name, render in figures:
+        path = os.path.join(out_dir, f"{name}.{fmt}")
+        render(save_path=path)
+        print(f"Saved {path}")
+
+
+if __name__ == "__main__":
+    render_all(*sys.argv[1:3])
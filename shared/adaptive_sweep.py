@@ -0,0 +1,229 @@
+"""
+AdaptiveSweep
+
+Adaptive ρ sweep shared by the M/M/1 and M/D/1 visualizations.
+
+A fixed grid with the same sim_time at every point overspends at low ρ and
+undersamples the ρ → 1 region. This module instead:
+- refines the ρ grid where the theoretical curve or the simulation-vs-theory
+  gap changes fastest, and
+- splits a total simulation-time budget across points so that it grows
+  with the variance of the Wq estimate, which scales like 1/(1-ρ)^4.
+
+The split is a Neyman allocation: sim_time ∝ standard deviation, i.e.
+∝ 1/(1-ρ)^2, rather than ∝ variance. This minimizes the summed variance
+for a fixed budget. Weights are capped and every point gets a floor, so
+the last point cannot take most of the budget.
+"""
+
+from typing import Callable, Dict, List
+
+import numpy as np
+
+# Batches per run used to estimate the standard error of a simulated Wq
+_BATCHES = 10
+
+
+def allocation_weights(rhos: np.ndarray, max_weight_ratio: float = 4.0) -> np.ndarray:
+    """Standard deviation of the simulated Wq at each ρ, up to a constant: 1/(1-ρ)^2.
+
+    Weights are capped at max_weight_ratio times the smallest one so the
+    points closest to ρ = 1 cannot starve the rest of the sweep.
+    """
+    rhos = np.asarray(rhos, dtype=float)
+    weights = 1.0 / (1.0 - rhos) ** 2
+    return np.minimum(weights, max_weight_ratio * weights.min())
+
+
+def allocate_sim_time(
+    rhos: np.ndarray,
+    total_sim_time: float,
+    min_sim_time: float = 2000.0,
+    max_weight_ratio: float = 4.0,
+) -> np.ndarray:
+    """Split a total simulation-time budget across ρ points.
+
+    Every point first receives min_sim_time, the remainder is distributed in
+    proportion to allocation_weights(rhos).
+
+    Args:
+        rhos: Utilization values, each in (0, 1).
+        total_sim_time: Total simulation time to spend over all points.
+        min_sim_time: Floor on the simulation time of a single point.
+        max_weight_ratio: Cap on the ratio between the largest and smallest weight.
+
+    Returns:
+        Array of per-point simulation times summing to total_sim_time.
+    """
+    rhos = np.asarray(rhos, dtype=float)
+    floor = min_sim_time * len(rhos)
+    if floor > total_sim_time:
+        raise ValueError(
+            f"total_sim_time={total_sim_time} is below the floor of "
+            f"{len(rhos)} points x min_sim_time={min_sim_time}"
+        )
+    weights = allocation_weights(rhos, max_weight_ratio)
+    return min_sim_time + (total_sim_time - floor) * weights / weights.sum()
+
+
+def refine_rho_grid(
+    rhos: np.ndarray,
+    theoretical: np.ndarray,
+    gaps: np.ndarray,
+    gap_errors: np.ndarray,
+    n_new: int,
+    min_spacing: float = 0.005,
+) -> np.ndarray:
+    """Insert midpoints into the intervals where the curves change fastest.
+
+    Each interval [ρ_i, ρ_i+1] is scored by the change of the theoretical
+    curve plus the change of the simulation-vs-theory gap, both normalized
+    to their largest change on the grid. The gap change is measured in
+    standard errors and ignored below two, where it is indistinguishable
+    from noise. The n_new highest scoring intervals wider than
+    2 * min_spacing are split in half.
+
+    Args:
+        rhos: Sorted utilization grid.
+        theoretical: Theoretical Wq at each ρ.
+        gaps: Simulated minus theoretical Wq at each ρ.
+        gap_errors: Standard error of each gap.
+        n_new: Maximum number of points to insert.
+        min_spacing: Smallest allowed distance between grid points.
+
+    Returns:
+        The refined, sorted ρ grid.
+    """
+    rhos = np.asarray(rhos, dtype=float)
+    gap_errors = np.asarray(gap_errors, dtype=float)
+    d_theory = np.abs(np.diff(theoretical))
+    d_gap = np.abs(np.diff(gaps)) / np.maximum(np.hypot(gap_errors[:-1], gap_errors[1:]), 1e-12)
+    d_gap[d_gap < 2.0] = 0.0
+    score = d_theory / max(d_theory.max(), 1e-12) + d_gap / max(d_gap.max(), 1e-12)
+    score[np.diff(rhos) < 2.0 * min_spacing] = -np.inf
+
+    order = np.argsort(score)[::-1][:n_new]
+    order = order[np.isfinite(score[order])]
+    midpoints = 0.5 * (rhos[order] + rhos[order + 1])
+    return np.sort(np.concatenate([rhos, midpoints]))
+
+
+def adaptive_sweep(
+    simulate: Callable[[float, float, float], Dict[str, List[float]]],
+    theory: Callable[[float, float], float],
+    mu: float = 1.0,
+    total_sim_time: float = 190000.0,
+    rho_min: float = 0.05,
+    rho_max: float = 0.95,
+    initial_points: int = 8,
+    rounds: int = 2,
+    points_per_round: int = 2,
+    pilot_fraction: float = 0.2,
+    min_sim_time: float = 2000.0,
+    max_weight_ratio: float = 4.0,
+) -> Dict[str, np.ndarray]:
+    """Run an adaptive ρ sweep within a fixed simulation-time budget.
+
+    Each refinement round spends pilot_fraction / rounds of the budget on
+    the points it adds; a round only adds as many points as the remaining
+    budget can run at min_sim_time. A final pass gives those points the
+    floor and splits what is left over the points still below their share
+    of total_sim_time, in proportion to their shortfall; top-ups shorter
+    than min_sim_time are skipped, so the total never exceeds total_sim_time. Waiting times from every run at
+    the same ρ are pooled, so no pilot work is lost.
+
+    Args:
+        simulate: simulate_mm1 or simulate_md1.
+        theory: Matching theoretical Wq function.
+        mu: Service rate μ.
+        total_sim_time: Total simulation time over all points and rounds.
+        rho_min: Lowest utilization of the sweep.
+        rho_max: Highest utilization of the sweep.
+        initial_points: Size of the initial uniform grid.
+        rounds: Number of refinement rounds.
+        points_per_round: Points inserted per refinement round.
+        pilot_fraction: Share of the budget spent during refinement.
+        min_sim_time: Floor on the simulation time of a single run.
+        max_weight_ratio: Cap on the ratio between the largest and smallest weight.
+
+    Returns:
+        Dictionary with arrays:
+            - 'rhos': refined utilization grid
+            - 'simulated_wq': pooled simulated Wq at each ρ
+            - 'theoretical_wq': theoretical Wq at each ρ
+            - 'sim_times': total simulation time spent at each ρ
+    """
+    pilot_budget = pilot_fraction * total_sim_time / max(rounds, 1)
+    if rounds and pilot_budget < min_sim_time * max(initial_points, points_per_round):
+        raise ValueError(
+            f"pilot budget {pilot_budget:.0f} per round cannot give every new point "
+            f"min_sim_time={min_sim_time}; raise total_sim_time or pilot_fraction"
+        )
+    if rounds and (1.0 - pilot_fraction) * total_sim_time < min_sim_time * points_per_round:
+        raise ValueError(
+            f"pilot_fraction={pilot_fraction} leaves no room to run the "
+            f"{points_per_round} points added by the last round; lower pilot_fraction"
+        )
+
+    wait_sums: Dict[float, float] = {}
+    wait_counts: Dict[float, int] = {}
+    batch_means: Dict[float, List[float]] = {}
+    spent: Dict[float, float] = {}
+
+    def run(rhos: np.ndarray, sim_times: np.ndarray) -> None:
+        for rho, t in zip(rhos, sim_times):
+            if t < min_sim_time:
+                continue
+            wait_q = np.asarray(simulate(rho * mu, mu, float(t))["wait_queue_times"])
+            wait_sums[rho] = wait_sums.get(rho, 0.0) + float(wait_q.sum())
+            wait_counts[rho] = wait_counts.get(rho, 0) + len(wait_q)
+            if len(wait_q) >= _BATCHES:
+                batches = np.array_split(wait_q, _BATCHES)
+                batch_means.setdefault(rho, []).extend(b.mean() for b in batches)
+            spent[rho] = spent.get(rho, 0.0) + float(t)
+
+    def summarize(rhos: np.ndarray) -> Dict[str, np.ndarray]:
+        sim = np.array([wait_sums[r] / wait_counts[r] if wait_counts[r] else 0.0 for r in rhos])
+        th = np.array([theory(r * mu, mu) for r in rhos])
+        return {
+            "rhos": rhos,
+            "simulated_wq": sim,
+            "theoretical_wq": th,
+            "sim_times": np.array([spent[r] for r in rhos]),
+        }
+
+    def standard_errors(rhos: np.ndarray) -> np.ndarray:
+        errors = []
+        for r in rhos:
+            means = batch_means.get(r, [])
+            errors.append(np.std(means, ddof=1) / np.sqrt(len(means)) if len(means) > 1 else np.inf)
+        return np.array(errors)
+
+    rhos = np.linspace(rho_min, rho_max, initial_points)
+    for _ in range(rounds):
+        new_rhos = np.array([r for r in rhos if r not in spent])
+        if len(new_rhos):
+            run(new_rhos, allocate_sim_time(new_rhos, pilot_budget, min_sim_time, max_weight_ratio))
+        # Only add points the remaining budget can still run
+        n_new = min(points_per_round, int((total_sim_time - sum(spent.values())) // min_sim_time))
+        if n_new <= 0:
+            break
+        current = summarize(rhos)
+        gaps = current["simulated_wq"] - current["theoretical_wq"]
+        rhos = refine_rho_grid(
+            rhos, current["theoretical_wq"], gaps, standard_errors(rhos), n_new
+        )
+
+    # Spread the remaining budget over the points below their share of it
+    targets = allocate_sim_time(rhos, total_sim_time, min_sim_time, max_weight_ratio)
+    shortfall = np.maximum(targets - np.array([spent.get(r, 0.0) for r in rhos]), 0.0)
+    remaining = total_sim_time - sum(spent.values())
+    # Points added in the last round have no run yet and get the floor first
+    floor = np.where([r not in spent for r in rhos], min_sim_time, 0.0)
+    extra = np.maximum(shortfall - floor, 0.0)
+    rest = remaining - floor.sum()
+    if rest > 0.0 and extra.sum() > 0.0:
+        floor += extra * min(1.0, rest / extra.sum())
+    if floor.sum() > 0.0:
+        run(rhos, floor)
+    return summarize(rhos)
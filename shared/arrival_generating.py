@@ -10,13 +10,19 @@ import numpy as np
 class ArrivalGenerating:
     """Generate arrivals according to a Poisson process (exponential inter-arrival times)."""
 
-    def __init__(self, lambda_rate: float) -> None:
+    def __init__(self, lambda_rate: float, first_entity_id: int = 0) -> None:
         """
         Args:
             lambda_rate: Arrival rate λ (entities per unit time).
+            first_entity_id: Id of the first entity (non-zero when resuming a run).
         """
         self.lambda_rate = lambda_rate
-        self._next_entity_id = 0
+        self._next_entity_id = first_entity_id
+
+    @property
+    def entities_generated(self) -> int:
+        """Number of entity ids handed out so far."""
+        return self._next_entity_id
 
     def next_interarrival(self) -> float:
         """Sample the next inter-arrival time ~ Exp(λ)."""
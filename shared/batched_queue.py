@@ -0,0 +1,121 @@
+"""
+BatchedQueue
+
+Vectorized single-server FIFO kernel for many independent queues at once.
+
+A (P × R) matrix of queues, P parameter points (λ, μ) times R replications,
+is advanced in lockstep, a chunk of customers at a time, with NumPy array
+operations instead of one Python event loop per queue. Waiting times follow
+the Lindley recursion
+
+    Wq_k = max(0, Wq_{k-1} + S_{k-1} - A_k)
+
+which is evaluated for a whole chunk through a cumulative sum and a running
+minimum, carrying Wq and S of the last customer over to the next chunk.
+"""
+
+from statistics import NormalDist
+from typing import Dict, Sequence, Union
+
+import numpy as np
+
+
+def _exponential(rate: np.ndarray, size: tuple) -> np.ndarray:
+    """Sample Exp(rate) by inverse transform, as ArrivalGenerating / ServiceUnit do."""
+    u = np.random.random(size)
+    return -np.log(1.0 - u) / rate
+
+
+def simulate_batched(
+    lambda_rates: Union[float, Sequence[float]],
+    mu_rates: Union[float, Sequence[float]] = 1.0,
+    sim_time: float = 10000.0,
+    n_replications: int = 100,
+    service: str = "exponential",
+    confidence: float = 0.95,
+    chunk_size: int = 256,
+) -> Dict[str, np.ndarray]:
+    """Simulate P × R independent M/M/1 or M/D/1 queues in one vectorized pass.
+
+    Wq counts every customer arriving in [0, sim_time], including the part
+    of its wait that falls after sim_time; Lq only integrates the queue
+    length over [0, sim_time].
+
+    Args:
+        lambda_rates: Arrival rates λ, scalar or one per parameter point.
+        mu_rates: Service rates μ, scalar or one per parameter point;
+            broadcast against lambda_rates to give the P points.
+        sim_time: Simulation end time of every queue.
+        n_replications: Independent replications R per parameter point.
+        service: "exponential" (M/M/1) or "deterministic" (M/D/1).
+        confidence: Confidence level of the reported intervals.
+        chunk_size: Customers generated per queue and step.
+
+    Returns:
+        Dictionary with arrays:
+            - 'wq': mean waiting time in queue per cell, shape (P, R)
+            - 'lq': time-average queue length per cell, shape (P, R)
+            - 'customers': number of customers per cell, shape (P, R)
+            - 'wq_mean', 'wq_ci_low', 'wq_ci_high': Wq over replications, shape (P,)
+            - 'lq_mean', 'lq_ci_low', 'lq_ci_high': Lq over replications, shape (P,)
+    """
+    if service not in ("exponential", "deterministic"):
+        raise ValueError(f"Unknown service type: {service!r}")
+
+    lam, mu = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(lambda_rates, dtype=float)),
+        np.atleast_1d(np.asarray(mu_rates, dtype=float)),
+    )
+    lam = lam[:, None, None]
+    mu = mu[:, None, None]
+    shape = (lam.shape[0], n_replications)
+    chunk_shape = shape + (chunk_size,)
+
+    clock = np.zeros(shape)  # arrival time of the last generated customer
+    last_wait = np.zeros(shape)  # Wq of the last generated customer
+    last_service = np.zeros(shape)
+    wait_sum = np.zeros(shape)
+    queue_area = np.zeros(shape)  # waiting time falling inside [0, sim_time]
+    customers = np.zeros(shape, dtype=np.int64)
+
+    while np.any(clock <= sim_time):
+        interarrival = _exponential(lam, chunk_shape)
+        if service == "exponential":
+            service_times = _exponential(mu, chunk_shape)
+        else:
+            service_times = np.broadcast_to(1.0 / mu, chunk_shape)
+
+        arrivals = clock[..., None] + np.cumsum(interarrival, axis=-1)
+
+        # Lindley recursion for the whole chunk
+        prev_service = np.concatenate(
+            [last_service[..., None], service_times[..., :-1]], axis=-1
+        )
+        c = np.cumsum(prev_service - interarrival, axis=-1)
+        carry = np.maximum(last_wait[..., None], -np.minimum.accumulate(c, axis=-1))
+        waits = np.maximum(c + carry, 0.0)
+
+        valid = arrivals <= sim_time
+        wait_sum += np.where(valid, waits, 0.0).sum(axis=-1)
+        queue_area += np.where(valid, np.minimum(waits, sim_time - arrivals), 0.0).sum(axis=-1)
+        customers += valid.sum(axis=-1)
+
+        clock = arrivals[..., -1]
+        last_wait = waits[..., -1]
+        last_service = service_times[..., -1]
+
+    wq = np.divide(wait_sum, customers, out=np.zeros(shape), where=customers > 0)
+    # Area under the queue-length curve equals the waiting time spent before sim_time
+    lq = queue_area / sim_time
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    result = {"wq": wq, "lq": lq, "customers": customers}
+    for name, values in (("wq", wq), ("lq", lq)):
+        mean = values.mean(axis=1)
+        half = np.zeros_like(mean)
+        if n_replications > 1:
+            half = z * values.std(axis=1, ddof=1) / np.sqrt(n_replications)
+        result[f"{name}_mean"] = mean
+        result[f"{name}_ci_low"] = mean - half
+        result[f"{name}_ci_high"] = mean + half
+    return result
@@ -0,0 +1,213 @@
+"""
+Checkpoint
+
+Snapshot files for resuming long simulate_mm1 / simulate_md1 runs.
+
+A snapshot holds everything the event loop needs to continue bit-exactly:
+the event list, the FIFO queue contents, per-entity timestamps, the
+arrival generator position, the NumPy RNG state and the running sum of
+queue waiting times. Its size depends on the number of entities in the
+system, not on the run length.
+
+The per-customer series returned by the simulations are not part of the
+snapshot. Each checkpoint appends only their new values to one raw float64
+file per series next to the snapshot (<path>.<series>.f64), and the
+snapshot records how many values are valid, so total checkpoint I/O stays
+linear in the run length.
+
+Snapshots are .npz files with the small fields stored as JSON and are read
+with allow_pickle=False, so loading one never executes code. Files are
+written atomically so a kill mid-write never corrupts the previous snapshot.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from shared.arrival_generating import ArrivalGenerating
+from shared.fifo_queue import FIFOQueue
+
+SNAPSHOT_VERSION = 2
+
+SERIES_NAMES = (
+    "wait_queue_times",
+    "service_times",
+    "system_times",
+    "mean_wait_queue_times",
+    "mean_wait_queue_times_times",
+)
+
+
+def series_path(path: str, name: str) -> str:
+    """File holding the appended values of one statistics series."""
+    return f"{path}.{name}.f64"
+
+
+def _check_series_file(path: str, length: int) -> None:
+    """Raise ValueError unless the series file at path holds at least length values."""
+    if not os.path.isfile(path):
+        raise ValueError(f"Missing series file: {path}")
+    if os.path.getsize(path) < length * 8:
+        raise ValueError(
+            f"Series file {path} holds {os.path.getsize(path) // 8} values, "
+            f"the snapshot expects {length}"
+        )
+
+
+def prepare_series_files(
+    checkpoint_path: str,
+    resume_from: Optional[str],
+    lengths: Dict[str, int],
+) -> Dict[str, int]:
+    """Set up the series files of checkpoint_path and return how much of each is written.
+
+    When resuming into the same snapshot, values appended after that snapshot
+    are cut off; otherwise the files start empty and are rewritten in full at
+    the first checkpoint.
+
+    Raises:
+        ValueError: If a series file of the resumed snapshot is missing or short.
+    """
+    same_file = resume_from is not None and os.path.abspath(resume_from) == os.path.abspath(
+        checkpoint_path
+    )
+    flushed = {}
+    for name in SERIES_NAMES:
+        path = series_path(checkpoint_path, name)
+        if same_file:
+            _check_series_file(path, lengths[name])
+            os.truncate(path, lengths[name] * 8)
+            flushed[name] = lengths[name]
+        else:
+            open(path, "wb").close()
+            flushed[name] = 0
+    return flushed
+
+
+def save_snapshot(
+    path: str,
+    model: str,
+    lambda_rate: float,
+    mu_rate: float,
+    current_time: float,
+    events: List[Tuple[float, str, int]],
+    queue: FIFOQueue,
+    server_busy: bool,
+    arrivals: ArrivalGenerating,
+    pending_arrival: Optional[float],
+    arrival_time: Dict[int, float],
+    service_start_time: Dict[int, float],
+    accumulators: Dict[str, float],
+    stats: Dict[str, List[float]],
+    flushed: Dict[str, int],
+) -> None:
+    """Append new series values, then write the simulation state to path (atomically).
+
+    flushed maps each series to the number of values already on disk and is
+    updated in place.
+    """
+    for name in SERIES_NAMES:
+        values = stats[name]
+        with open(series_path(path, name), "ab") as f:
+            np.asarray(values[flushed[name]:], dtype=np.float64).tofile(f)
+            f.flush()
+            os.fsync(f.fileno())
+        flushed[name] = len(values)
+
+    rng_name, rng_keys, rng_pos, rng_has_gauss, rng_cached_gaussian = np.random.get_state()
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "model": model,
+        "lambda_rate": lambda_rate,
+        "mu_rate": mu_rate,
+        "current_time": current_time,
+        "server_busy": server_busy,
+        "next_entity_id": arrivals.entities_generated,
+        "pending_arrival": pending_arrival,
+        "rng": [rng_name, int(rng_pos), int(rng_has_gauss), float(rng_cached_gaussian)],
+        "accumulators": accumulators,
+        "series_lengths": dict(flushed),
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            meta=np.array(json.dumps(meta)),
+            event_times=np.array([e[0] for e in events], dtype=np.float64),
+            event_types=np.array([e[1] for e in events], dtype="U9"),
+            event_ids=np.array([e[2] for e in events], dtype=np.int64),
+            queue=np.array(list(queue), dtype=np.int64),
+            arrival_ids=np.array(list(arrival_time), dtype=np.int64),
+            arrival_times=np.array(list(arrival_time.values()), dtype=np.float64),
+            service_ids=np.array(list(service_start_time), dtype=np.int64),
+            service_times=np.array(list(service_start_time.values()), dtype=np.float64),
+            rng_keys=rng_keys,
+        )
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(
+    path: str,
+    model: str,
+    lambda_rate: float,
+    mu_rate: float,
+    sim_time: float,
+) -> Dict[str, Any]:
+    """Read a snapshot written by save_snapshot and restore the NumPy RNG state.
+
+    The statistics series are read back from their files, up to the lengths
+    recorded in the snapshot.
+
+    Raises:
+        ValueError: If the snapshot belongs to a different model or (λ, μ),
+            was taken after sim_time, or a series file is missing or short.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    state = json.loads(str(arrays["meta"]))
+
+    if state.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {state.get('version')!r}")
+    if (state["model"], state["lambda_rate"], state["mu_rate"]) != (model, lambda_rate, mu_rate):
+        raise ValueError(
+            f"Snapshot {path} is for {state['model']} with λ={state['lambda_rate']}, "
+            f"μ={state['mu_rate']}, not {model} with λ={lambda_rate}, μ={mu_rate}"
+        )
+    if sim_time < state["current_time"]:
+        raise ValueError(
+            f"Snapshot {path} was taken at t={state['current_time']}, "
+            f"past sim_time={sim_time}"
+        )
+    for name in SERIES_NAMES:
+        _check_series_file(series_path(path, name), state["series_lengths"][name])
+
+    rng_name, rng_pos, rng_has_gauss, rng_cached_gaussian = state["rng"]
+    np.random.set_state(
+        (rng_name, arrays["rng_keys"], rng_pos, rng_has_gauss, rng_cached_gaussian)
+    )
+
+    state["events"] = list(
+        zip(
+            arrays["event_times"].tolist(),
+            arrays["event_types"].tolist(),
+            arrays["event_ids"].tolist(),
+        )
+    )
+    state["queue"] = arrays["queue"].tolist()
+    state["arrival_time"] = dict(
+        zip(arrays["arrival_ids"].tolist(), arrays["arrival_times"].tolist())
+    )
+    state["service_start_time"] = dict(
+        zip(arrays["service_ids"].tolist(), arrays["service_times"].tolist())
+    )
+    state["stats"] = {
+        name: np.fromfile(
+            series_path(path, name), dtype=np.float64, count=state["series_lengths"][name]
+        ).tolist()
+        for name in SERIES_NAMES
+    }
+    return state
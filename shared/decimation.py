@@ -0,0 +1,100 @@
+"""
+Decimation
+
+Downsampling of long time series before plotting.
+
+The running-mean series returned by simulate_mm1 / simulate_md1 has one point
+per departure, far more than the pixels it is drawn on. Decimating to the
+figure width keeps the visible shape while making matplotlib cheap again.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def minmax_decimate(
+    x: Sequence[float],
+    y: Sequence[float],
+    n_buckets: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the minimum and maximum of y in each of n_buckets equal-size buckets.
+
+    Preserves spikes exactly, so the plotted envelope matches the full series.
+    The first and last point are always kept. Returns at most 2 * n_buckets + 2
+    points, in original x order.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_buckets <= 0 or n <= 2 * n_buckets:
+        return x, y
+
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+    keep = [0, n - 1]
+    for start, stop in zip(edges[:-1], edges[1:]):
+        bucket = y[start:stop]
+        keep.append(start + int(np.argmin(bucket)))
+        keep.append(start + int(np.argmax(bucket)))
+    idx = np.unique(keep)
+    return x[idx], y[idx]
+
+
+def lttb(
+    x: Sequence[float],
+    y: Sequence[float],
+    n_out: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling to n_out points.
+
+    Keeps the first and last point and, from each bucket in between, the point
+    forming the largest triangle with the previously kept point and the mean
+    of the next bucket.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    idx = np.empty(n_out, dtype=int)
+    idx[0] = 0
+    idx[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+
+    return x[idx], y[idx]
+
+
+def decimate_for_plot(
+    x: Sequence[float],
+    y: Sequence[float],
+    width_px: int = 1500,
+    method: str = "lttb",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Downsample a series to roughly one point per horizontal pixel.
+
+    Args:
+        x: Sample times.
+        y: Sample values.
+        width_px: Target pixel width of the plot (figure width × dpi).
+        method: "lttb" or "minmax".
+    """
+    if method == "lttb":
+        return lttb(x, y, width_px)
+    if method == "minmax":
+        return minmax_decimate(x, y, width_px // 2)
+    raise ValueError(f"Unknown decimation method: {method!r}")
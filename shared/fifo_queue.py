@@ -5,7 +5,7 @@ Simple FIFO queue wrapper used by the M/M/1 simulation.
 """
 
 from collections import deque
-from typing import Deque, Optional, Any
+from typing import Deque, Iterator, Optional, Any
 
 
 class FIFOQueue:
@@ -27,4 +27,8 @@ class FIFOQueue:
     def __len__(self) -> int:
         return len(self._queue)
 
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate from front to back without removing items."""
+        return iter(self._queue)
+
 